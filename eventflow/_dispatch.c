@@ -0,0 +1,89 @@
+/*
+ * Optional C implementation of the dispatch loop of the event bus.
+ *
+ * ``dispatch(listeners, payload)`` calls every listener in the tuple
+ * ``listeners`` with ``payload`` as its only positional argument. If a
+ * listener raises, the exception is propagated and the remaining listeners
+ * are not called, just like the pure Python fallback in ``eventflow.bus``.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+static PyObject *
+dispatch_listeners(PyObject *listeners, PyObject *payload)
+{
+    Py_ssize_t i, n;
+    PyObject *result;
+
+    if (!PyTuple_Check(listeners)) {
+        PyErr_SetString(PyExc_TypeError, "listeners must be a tuple");
+        return NULL;
+    }
+
+    n = PyTuple_GET_SIZE(listeners);
+
+    for (i = 0; i < n; i++) {
+#if PY_VERSION_HEX >= 0x03090000
+        result = PyObject_CallOneArg(PyTuple_GET_ITEM(listeners, i), payload);
+#else
+        result = PyObject_CallFunctionObjArgs(PyTuple_GET_ITEM(listeners, i), payload, NULL);
+#endif
+        if (result == NULL) {
+            return NULL;
+        }
+
+        Py_DECREF(result);
+    }
+
+    Py_RETURN_NONE;
+}
+
+#if PY_VERSION_HEX >= 0x03070000
+static PyObject *
+dispatch(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs != 2) {
+        PyErr_SetString(PyExc_TypeError, "dispatch() takes exactly 2 arguments");
+        return NULL;
+    }
+
+    return dispatch_listeners(args[0], args[1]);
+}
+
+#define DISPATCH_FLAGS METH_FASTCALL
+#else
+static PyObject *
+dispatch(PyObject *self, PyObject *args)
+{
+    PyObject *listeners, *payload;
+
+    if (!PyArg_UnpackTuple(args, "dispatch", 2, 2, &listeners, &payload)) {
+        return NULL;
+    }
+
+    return dispatch_listeners(listeners, payload);
+}
+
+#define DISPATCH_FLAGS METH_VARARGS
+#endif
+
+static PyMethodDef dispatch_methods[] = {
+    {"dispatch", (PyCFunction)(void (*)(void))dispatch, DISPATCH_FLAGS,
+     "dispatch(listeners, payload)\n\nCall every listener with the payload."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef dispatch_module = {
+    PyModuleDef_HEAD_INIT,
+    "eventflow._dispatch",
+    "C implementation of the dispatch loop of the event bus.",
+    -1,
+    dispatch_methods
+};
+
+PyMODINIT_FUNC
+PyInit__dispatch(void)
+{
+    return PyModule_Create(&dispatch_module);
+}
@@ -1,13 +1,35 @@
-from collections import defaultdict
+import asyncio
 import datetime
-import pytz
+import functools
+import inspect
+import sys
 from typing import (
+    Any,
     Callable,
     Dict,
     List,
-    Optional
+    Optional,
+    Tuple
 )
 
+def _dispatch_py(listeners: Tuple[Callable, ...], payload: Any) -> None:
+    """
+    Call every listener with the payload. Used when the optional 
+    C extension is not available; behaves the same as its ``dispatch``.
+    """
+
+    if not isinstance(listeners, tuple):
+        raise TypeError("listeners must be a tuple")
+
+    for f in listeners:
+        f(payload)
+
+
+try:
+    from ._dispatch import dispatch as _dispatch
+except ImportError:
+    _dispatch = _dispatch_py
+
 
 class Event:
     """
@@ -36,39 +58,119 @@ class Event:
 
         For customization, the following class variables can be set:
         
-        - ``default_timezone``. Defines the The timezone that is used by default to create a timestamp for the specific event.
+        - ``default_timezone``. Defines the timezone (a ``tzinfo`` object, not a zone name) that is used by default to create a timestamp for the specific event.
+
+        Events define ``__slots__``; subclasses that add attributes should declare their own ``__slots__`` as well.
 
     :param event_type: The type of event.
     :type event_type: str
     :param data: The data sent with the event.
     :type data: dict
+    :param timestamp: The date and time the event was fired, defaults to now.
+    :type timestamp: datetime.datetime
     """
 
+    __slots__ = ("event_type", "data", "timestamp")
+
     # The timezone that is used by default to 
-    # create a timestamp for the specific event
-    default_timezone: str = pytz.utc.zone
+    # create a timestamp for the specific event.
+    # Resolved once, so no zone lookup is done per event
+    default_timezone: datetime.tzinfo = datetime.timezone.utc
 
-    def __init__(self, event_type: str, data: Optional[Dict] = {}) -> None:
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Reject zone names as ``default_timezone``, which earlier versions 
+        accepted, with a clear error instead of failing on every event.
+        """
+
+        super().__init_subclass__(**kwargs)
+
+        if isinstance(cls.__dict__.get("default_timezone"), str):
+            raise TypeError(
+                f"{cls.__name__}.default_timezone must be a tzinfo object, "
+                f"not the zone name {cls.__dict__['default_timezone']!r}."
+            )
+
+    def __init__(
+        self,
+        event_type: str,
+        data: Optional[Dict] = None,
+        timestamp: Optional[datetime.datetime] = None
+    ) -> None:
         """
         Initialize a new event object.
         """
 
+        if data is None:
+            data = {}
+
+        if timestamp is None:
+            timestamp = datetime.datetime.now(tz=self.default_timezone)
+
         self.event_type = event_type
         self.data = data
-        self.timestamp = datetime.datetime.now(tz=pytz.timezone(self.default_timezone))
+        self.timestamp = timestamp
 
     def __repr__(self) -> str:
         """
         Return the representation.
         """
 
-        args = [
-            "event_type={}".format(self.event_type),
-            "data={}".format(self.data),
-            "timestamp={}".format(self.timestamp),
-        ]
-        
-        return "<{} {}>".format(type(self).__name__, ", ".join(args))
+        return (
+            f"<{type(self).__name__} event_type={self.event_type}, "
+            f"data={self.data}, timestamp={self.timestamp}>"
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        """
+        Return a field of the dict representation of an event, so listeners 
+        written for :py:meth:`EventBus.fire` also accept an `Event` object.
+
+        :param key: Either ``"metadata"`` or ``"data"``
+        :type key: str
+        :raises KeyError: If the key is not part of the event structure.
+
+        >>> event["data"]
+        {}
+        """
+
+        if key == "data":
+            return self.data
+
+        if key == "metadata":
+            return {
+                "event_type": self.event_type,
+                "timestamp": self.timestamp
+            }
+
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Return whether a key is part of the dict representation of an event.
+        """
+
+        return key == "data" or key == "metadata"
+
+    # Item access does not make an event a sequence, so iterating raises a
+    # TypeError instead of falling back to ``__getitem__`` with integers
+    __iter__ = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Return a field of the dict representation of an event, or the 
+        default if the key is not part of the event structure.
+
+        :param key: Either ``"metadata"`` or ``"data"``
+        :type key: str
+        :param default: The value returned for unknown keys, defaults to None
+        :type default: Any, optional
+        """
+
+        if key in self:
+            return self[key]
+
+        return default
 
     def as_dict(self) -> Dict:
         """
@@ -91,14 +193,17 @@ class EventBus:
     The `EventBus` class is responsible for the firing and listening of events.
 
     For event management, a ``dict`` is used to store the event type 
-    with a list of listeners associated to the event type. The listeners 
-    are accessible via the name of the event type.
+    with the listeners associated to the event type. The listeners of an 
+    event type are kept in an insertion-ordered ``dict`` that maps the 
+    handle returned by :py:meth:`append` to the listener, so removing a 
+    listener by its handle is O(1). The listeners are accessible via the 
+    name of the event type.
 
     .. admonition:: Customization
 
         For customization, the following class variables can be set:
         
-        - ``event_class``. Defines the class that will be used to create event instances.
+        - ``event_class``. Defines the class that will be used to create event instances. It is called with the event type, the data and an optional ``timestamp`` keyword argument, which it must accept.
     """
 
     # The class that will be used to create event instances
@@ -109,7 +214,15 @@ class EventBus:
         Create a new EventBus instance.
         """
 
-        self._events = defaultdict(list)  # type: Dict[Any, List[Callable]]
+        self._events = {}  # type: Dict[Any, Dict[object, Callable]]
+
+        # Total number of listeners, kept up to date on every mutation
+        self._count = 0
+
+        # A frozen tuple of listeners and a dispatch function per event 
+        # type, built on the first fire and invalidated on every mutation
+        self._snapshots = {}  # type: Dict[Any, Tuple[Callable, ...]]
+        self._dispatchers = {}  # type: Dict[Any, Callable[[Any], None]]
 
     def __len__(self) -> int:
         """
@@ -122,18 +235,14 @@ class EventBus:
         0
         """
 
-        return sum(len(value) for value in self._events.values())
+        return self._count
 
     def __repr__(self) -> str:
         """
         Return the representation.
         """
 
-        args = [
-            "events={}".format(len(self._events)),
-        ]
-        
-        return "<{} {}>".format(type(self).__name__, ", ".join(args))
+        return f"<{type(self).__name__} events={len(self._events)}>"
 
     @property
     def listeners(self) -> Dict[str, int]:
@@ -149,7 +258,7 @@ class EventBus:
 
         return {event_type: len(listeners) for event_type, listeners in self._events.items()}
 
-    def append(self, event_type: str, listener: Callable) -> None:
+    def append(self, event_type: str, listener: Callable) -> object:
         """
         Append a listener to a specific event type.
 
@@ -157,21 +266,113 @@ class EventBus:
         :type event_type: str
         :param listener: A function
         :type listener: Callable
+        :return: A handle that can be passed to :py:meth:`unsubscribe`
+        :rtype: object
         """
 
-        self._events[event_type].append(listener)
+        # Store event types interned, so lookups of equal 
+        # interned strings succeed on an identity check
+        if type(event_type) is str:
+            event_type = sys.intern(event_type)
+
+        token = object()
+
+        self._events.setdefault(event_type, {})[token] = listener
+        self._count += 1
+        self._invalidate(event_type)
+
+        return token
 
     def remove(self, event_type: str, listener: Callable) -> None:
         """
-        Remove a listener of a specific event type.
+        Remove a listener of a specific event type. If the listener was 
+        appended more than once, the first registration is removed.
+
+        This searches the listeners of the event type, which is O(n). Use 
+        :py:meth:`unsubscribe` with the handle returned by :py:meth:`append` 
+        to remove a listener in O(1).
         
         :param event_type: The type of event
         :type event_type: str
         :param listener: A function
         :type listener: Callable
+        :raises ValueError: If the listener is not registered for the event type.
+        """
+
+        listeners = self._events.get(event_type, {})
+
+        for key, f in listeners.items():
+            if f == listener:
+                break
+        else:
+            raise ValueError(f"Listener is not registered for event type {event_type!r}.")
+
+        del listeners[key]
+        self._count -= 1
+        self._invalidate(event_type)
+
+    def unsubscribe(self, event_type: str, token: object) -> None:
         """
+        Remove a listener of a specific event type by the handle returned 
+        by :py:meth:`append`.
 
-        self._events[event_type].remove(listener)
+        :param event_type: The type of event
+        :type event_type: str
+        :param token: The handle returned by :py:meth:`append`
+        :type token: object
+        :raises ValueError: If the handle is not registered for the event type.
+        """
+
+        try:
+            del self._events[event_type][token]
+        except KeyError:
+            raise ValueError(f"Handle is not registered for event type {event_type!r}.") from None
+
+        self._count -= 1
+        self._invalidate(event_type)
+
+    def _invalidate(self, event_type: str) -> None:
+        """
+        Discard the cached listener snapshot and dispatch function of a 
+        specific event type.
+
+        :param event_type: The type of event
+        :type event_type: str
+        """
+
+        self._snapshots.pop(event_type, None)
+        self._dispatchers.pop(event_type, None)
+
+    def _compile(self, event_type: str) -> Optional[Callable[[Any], None]]:
+        """
+        Build and cache the listener snapshot and dispatch function of a 
+        specific event type.
+
+        The snapshot is an immutable tuple, so dispatching never has to copy 
+        it, even when listeners modify the event bus while being fired. With 
+        no listeners there is no dispatch function, a single listener is 
+        its own dispatch function, and multiple listeners are called in order.
+
+        :param event_type: The type of event
+        :type event_type: str
+        :return: The dispatch function, or None if there are no listeners
+        :rtype: Optional[Callable[[Any], None]]
+        """
+
+        listeners = self._events.get(event_type)
+
+        if not listeners:
+            return None
+
+        listeners = self._snapshots[event_type] = tuple(listeners.values())
+
+        if len(listeners) == 1:
+            dispatch = listeners[0]
+        else:
+            dispatch = functools.partial(_dispatch, listeners)
+
+        self._dispatchers[event_type] = dispatch
+        return dispatch
 
     def listen(self, event_type: str) -> Callable:
         """
@@ -190,7 +391,7 @@ class EventBus:
         """        
 
         def decorator(f):
-            self._events[event_type].append(f)
+            self.append(event_type, f)
             return f
 
         return decorator
@@ -198,34 +399,78 @@ class EventBus:
     def fire(
         self,
         event_type: str,
-        data: Optional[Dict] = {}
+        data: Optional[Dict] = None
     ) -> None:
         """
         Fire an event. This will fire every listener. Synchronous.
 
+        Every listener is called with the event as its only positional 
+        argument. The listeners are snapshotted before dispatching, so a listener 
+        may append or remove listeners while the event is being fired. 
+        Such changes take effect from the next fire onwards.
+
+        :param event_type: The type of event
+        :type event_type: str
+        :param data: The data sent with the event, defaults to None
+        :type data: Optional[Dict], optional
+        """
+
+        dispatch = self._dispatchers.get(event_type)
+
+        if dispatch is None:
+            dispatch = self._compile(event_type)
+
+            # Nothing to do if no one is listening
+            if dispatch is None:
+                return
+
+        dispatch(self.event_class(event_type, data).as_dict())
+
+    def fire2(
+        self,
+        event_type: str,
+        data: Optional[Dict] = None
+    ) -> None:
+        """
+        Fire an event, passing the `Event` object itself to every listener
+        instead of its dict representation. Synchronous.
+
+        This skips building the nested dict of :py:meth:`Event.as_dict`, so
+        listeners read attributes instead, e.g. ``event.data["..."]``. 
+        Listeners written for :py:meth:`fire` keep working as long as they 
+        only use ``event[...]``, ``in`` or ``event.get(...)`` with the 
+        ``"metadata"`` and ``"data"`` keys. An `Event` is not a ``dict``.
+
         :param event_type: The type of event
         :type event_type: str
-        :param data: The data sent with the event, defaults to {}
+        :param data: The data sent with the event, defaults to None
         :type data: Optional[Dict], optional
         """
 
-        # Create an `Event` object
-        _event = Event(event_type, data)
+        dispatch = self._dispatchers.get(event_type)
+
+        if dispatch is None:
+            dispatch = self._compile(event_type)
 
-        for f in self._events[event_type]:
-            f(event=_event.as_dict())
+            # Nothing to do if no one is listening
+            if dispatch is None:
+                return
+
+        dispatch(self.event_class(event_type, data))
 
     def fire_multiple(
         self,
         event_types: List[str],
-        data: Optional[Dict] = {}
+        data: Optional[Dict] = None
     ) -> None:
         """
         Fire multiple events. This will fire every listener. Synchronous.
 
+        All events are fired with the same data and share a single timestamp.
+
         :param event_types: The types of events
         :type event_types: List[str]
-        :param data: The data sent with the event, defaults to {}
+        :param data: The data sent with the event, defaults to None
         :type data: Optional[Dict], optional
         :raises ValueError: If the argument `event_types` is of the wrong type.
         """
@@ -233,9 +478,72 @@ class EventBus:
         if not isinstance(event_types, List):
             raise ValueError("Argument `event_types` must be of type list.")
 
+        # Taken from the first event that is created, and only if someone 
+        # is listening, so the event class decides on the default timestamp
+        timestamp = None
+
         for event_type in event_types:
-            # Create an `Event` object
-            _event = Event(event_type, data)
+            dispatch = self._dispatchers.get(event_type)
+
+            if dispatch is None:
+                dispatch = self._compile(event_type)
+
+                # Skip event types no one is listening to
+                if dispatch is None:
+                    continue
+
+            _event = self.event_class(event_type, data, timestamp=timestamp)
+            timestamp = _event.timestamp
+
+            dispatch(_event.as_dict())
+
+    async def fire_async(
+        self,
+        event_type: str,
+        data: Optional[Dict] = None
+    ) -> None:
+        """
+        Fire an event. This will fire every listener. Asynchronous.
+
+        Listeners are called in order; listeners that return an awaitable 
+        (e.g. ``async def`` functions) are then awaited concurrently. 
+        Regular functions are called directly and run to completion before 
+        the next listener is called. If a listener raises, the awaitables 
+        of the listeners called before it are still awaited before the 
+        exception is propagated.
+
+        :param event_type: The type of event
+        :type event_type: str
+        :param data: The data sent with the event, defaults to None
+        :type data: Optional[Dict], optional
+        """
+
+        listeners = self._snapshots.get(event_type)
+
+        if listeners is None:
+            # Nothing to do if no one is listening
+            if self._compile(event_type) is None:
+                return
+
+            listeners = self._snapshots[event_type]
+
+        # Create the payload once and share it between listeners
+        payload = self.event_class(event_type, data).as_dict()
+
+        awaitables = []
+
+        try:
+            for f in listeners:
+                result = f(payload)
+
+                if inspect.isawaitable(result):
+                    awaitables.append(result)
+        except Exception:
+            # Finish the work already started, then report the original error
+            if awaitables:
+                await asyncio.gather(*awaitables, return_exceptions=True)
+
+            raise
 
-            for f in self._events[event_type]:
-                f(event=_event.as_dict())
+        if awaitables:
+            await asyncio.gather(*awaitables)
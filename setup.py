@@ -1,5 +1,6 @@
 from eventflow.version import __version__
-from setuptools import setup
+import platform
+from setuptools import Extension, setup
 
 NAME = "Eventflow"
 VERSION = __version__
@@ -8,10 +9,24 @@ AUTHOR = "Sven Kortekaas"
 URL = "https://github.com/SvenKortekaas04/Eventflow"
 LICENSE = "MIT License"
 REQUIRES_PYTHON = ">=3.6.0"
+CLASSIFIERS = [
+    "License :: OSI Approved :: MIT License",
+    "Programming Language :: Python :: 3",
+    "Programming Language :: Python :: Implementation :: CPython",
+    "Programming Language :: Python :: Implementation :: PyPy",
+]
 
 with open("README.md", "r") as f:
     LONG_DESCRIPTION = f.read()
 
+# Build the C dispatch loop. The extension is optional: if compiling 
+# fails, the pure Python fallback is used. On PyPy the fallback is always 
+# used, as the JIT handles it best.
+if platform.python_implementation() != "CPython":
+    EXT_MODULES = []
+else:
+    EXT_MODULES = [Extension("eventflow._dispatch", ["eventflow/_dispatch.c"], optional=True)]
+
 
 setup(
     name=NAME,
@@ -22,5 +37,8 @@ setup(
     author=AUTHOR,
     url=URL,
     license=LICENSE,
-    python_requires=REQUIRES_PYTHON
+    python_requires=REQUIRES_PYTHON,
+    classifiers=CLASSIFIERS,
+    packages=["eventflow"],
+    ext_modules=EXT_MODULES
 )
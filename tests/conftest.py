@@ -0,0 +1,8 @@
+import pytest
+
+from eventflow import EventBus
+
+
+@pytest.fixture
+def bus() -> EventBus:
+  return EventBus()
@@ -1,4 +1,11 @@
-from eventflow import EventBus
+import asyncio
+import datetime
+import pytest
+import sys
+import warnings
+
+from eventflow import EventBus, Event
+from eventflow import bus as bus_module
 
 # Database
 patients = {
@@ -14,6 +21,14 @@ patients = {
   }
 }
 
+def run(coroutine):
+  loop = asyncio.new_event_loop()
+
+  try:
+    return loop.run_until_complete(coroutine)
+  finally:
+    loop.close()
+
 def create_medical_record(event):
   patient = patients[event["data"]["patient_id"]]
   print("New medical record created for {}".format(patient["name"]))
@@ -77,4 +92,310 @@ def test_listeners(bus: EventBus):
   assert bus.listeners != {}
 
   print(bus.listeners)
-  bus.remove(event_type="new:patient", listener=create_medical_record)
\ No newline at end of file
+  bus.remove(event_type="new:patient", listener=create_medical_record)
+
+
+def test_fire_without_listeners(bus: EventBus):
+  bus.fire(event_type="unknown")
+  bus.fire_multiple(event_types=["unknown:1", "unknown:2"])
+  assert bus.listeners == {}
+
+
+def test_event_timestamp(bus: EventBus):
+  calls = []
+
+  @bus.listen(event_type="test")
+  def func(event):
+    calls.append(event["metadata"]["timestamp"])
+
+  bus.fire(event_type="test")
+  assert len(calls) == 1
+  assert calls[0].utcoffset().total_seconds() == 0
+
+
+def test_fire_without_data(bus: EventBus):
+  calls = []
+
+  @bus.listen(event_type="test")
+  def func(event):
+    calls.append(event["data"])
+
+  bus.fire(event_type="test")
+  bus.fire(event_type="test")
+  assert calls == [{}, {}]
+  assert type(calls[0]) is dict
+  assert calls[0] is not calls[1]
+
+
+def test_fire2(bus: EventBus):
+  calls = []
+
+  @bus.listen(event_type="new:patient")
+  def func(event):
+    calls.append((event.event_type, patients[event.data["patient_id"]]["name"]))
+
+  bus.fire2(event_type="new:patient", data={"patient_id": "2"})
+  assert calls == [("new:patient", "Donna M. Holmes")]
+
+
+def test_event_slots():
+  event = Event(event_type="test")
+  assert not hasattr(event, "__dict__")
+
+
+def test_len_remove_unknown_listener(bus: EventBus):
+  bus.append(event_type="new:patient", listener=create_medical_record)
+
+  with pytest.raises(ValueError):
+    bus.remove(event_type="new:patient", listener=print)
+
+  assert len(bus) == 1
+
+
+def test_append_duplicate_listener(bus: EventBus):
+  bus.append(event_type="new:patient", listener=create_medical_record)
+  bus.append(event_type="new:patient", listener=create_medical_record)
+  assert len(bus) == 2
+  assert bus.listeners == {"new:patient": 2}
+
+  bus.remove(event_type="new:patient", listener=create_medical_record)
+  assert bus.listeners == {"new:patient": 1}
+
+
+def test_unsubscribe(bus: EventBus):
+  token = bus.append(event_type="new:patient", listener=create_medical_record)
+  assert len(bus) == 1
+
+  bus.unsubscribe(event_type="new:patient", token=token)
+  assert len(bus) == 0
+
+  with pytest.raises(ValueError):
+    bus.unsubscribe(event_type="new:patient", token=token)
+
+
+def test_fire_modify_listeners(bus: EventBus):
+  calls = []
+
+  def second(event):
+    calls.append("second")
+
+  def first(event):
+    calls.append("first")
+    bus.remove(event_type="test", listener=first)
+    bus.append(event_type="test", listener=second)
+
+  bus.append(event_type="test", listener=first)
+  bus.fire(event_type="test")
+  assert calls == ["first"]
+
+  bus.fire(event_type="test")
+  assert calls == ["first", "second"]
+
+
+def test_fire_async(bus: EventBus):
+  calls = []
+
+  @bus.listen(event_type="test")
+  async def func(event):
+    await asyncio.sleep(0)
+    calls.append(event["data"]["message"])
+
+  @bus.listen(event_type="test")
+  def func2(event):
+    calls.append("sync")
+
+  run(bus.fire_async(event_type="test", data={"message": "Hello world!"}))
+  assert sorted(calls) == ["Hello world!", "sync"]
+
+
+def test_repr(bus: EventBus):
+  timestamp = datetime.datetime(2021, 4, 5, tzinfo=datetime.timezone.utc)
+  event = Event(event_type="test", data={"message": "Hello world!"}, timestamp=timestamp)
+
+  assert repr(event) == "<Event event_type=test, data={'message': 'Hello world!'}, timestamp=2021-04-05 00:00:00+00:00>"
+  assert repr(bus) == "<EventBus events=0>"
+
+
+def test_fire_positional(bus: EventBus):
+  calls = []
+
+  @bus.listen(event_type="test")
+  def func(payload):
+    calls.append(payload["data"]["message"])
+
+  bus.fire(event_type="test", data={"message": "Hello world!"})
+  assert calls == ["Hello world!"]
+
+
+def test_fire_multiple_timestamp(bus: EventBus):
+  timestamps = []
+
+  @bus.listen(event_type="1")
+  def func(event):
+    timestamps.append(event["metadata"]["timestamp"])
+
+  @bus.listen(event_type="2")
+  def func2(event):
+    timestamps.append(event["metadata"]["timestamp"])
+
+  bus.fire_multiple(event_types=["1", "2"])
+  assert len(timestamps) == 2
+  assert timestamps[0] is timestamps[1]
+
+
+def test_append_interns_event_type(bus: EventBus):
+  event_type = "".join(["new:", "patient"])
+  bus.append(event_type=event_type, listener=create_medical_record)
+
+  assert next(iter(bus.listeners)) is sys.intern("new:patient")
+
+
+def test_fire_listener_exception(bus: EventBus):
+  calls = []
+
+  @bus.listen(event_type="test")
+  def func(event):
+    raise KeyError("patient_id")
+
+  @bus.listen(event_type="test")
+  def func2(event):
+    calls.append(event)
+
+  with pytest.raises(KeyError):
+    bus.fire(event_type="test")
+
+  assert calls == []
+
+
+def test_fire2_dict_listener(bus: EventBus):
+  calls = []
+
+  @bus.listen(event_type="new:patient")
+  def func(event):
+    calls.append((event["metadata"]["event_type"], patients[event["data"]["patient_id"]]["name"]))
+
+  bus.fire2(event_type="new:patient", data={"patient_id": "1"})
+  assert calls == [("new:patient", "Charles A. Schneider")]
+
+
+def test_event_getitem():
+  event = Event(event_type="test", data={"message": "Hello world!"})
+
+  assert event["data"] == event.as_dict()["data"]
+  assert event["metadata"] == event.as_dict()["metadata"]
+
+  with pytest.raises(KeyError):
+    event["unknown"]
+
+  assert "data" in event
+  assert "unknown" not in event
+  assert event.get("data") == {"message": "Hello world!"}
+  assert event.get("unknown", 1) == 1
+
+  with pytest.raises(TypeError):
+    list(event)
+
+
+def test_fire_multiple_event_class(bus: EventBus):
+  class CustomEvent(Event):
+    __slots__ = ()
+
+    def __init__(self, event_type, data=None, *, timestamp=None):
+      super().__init__(event_type, data, timestamp)
+
+  bus.event_class = CustomEvent
+  events = []
+
+  @bus.listen(event_type="1")
+  def func(event):
+    events.append(event)
+
+  bus.fire_multiple(event_types=["1"])
+  bus.fire2(event_type="1")
+  assert len(events) == 2
+  assert isinstance(events[1], CustomEvent)
+
+
+def test_fire_async_listener_exception(bus: EventBus):
+  calls = []
+
+  @bus.listen(event_type="test")
+  async def func(event):
+    await asyncio.sleep(0)
+    calls.append("async")
+
+  @bus.listen(event_type="test")
+  def func2(event):
+    raise KeyError("patient_id")
+
+  with warnings.catch_warnings():
+    warnings.simplefilter("error")
+
+    with pytest.raises(KeyError):
+      run(bus.fire_async(event_type="test"))
+
+  assert calls == ["async"]
+
+
+def test_event_default_timezone_name():
+  with pytest.raises(TypeError):
+    class CustomEvent(Event):
+      default_timezone = "Europe/Amsterdam"
+
+
+def test_fire_multiple_event_class_without_default_timezone(bus: EventBus):
+  timestamp = datetime.datetime(2021, 4, 5, tzinfo=datetime.timezone.utc)
+
+  class CustomEvent:
+    def __init__(self, event_type, data=None, timestamp=None):
+      self.event_type = event_type
+      self.data = data
+      self.timestamp = timestamp or datetime.datetime(2021, 4, 5, tzinfo=datetime.timezone.utc)
+
+    def as_dict(self):
+      return {"metadata": {"event_type": self.event_type, "timestamp": self.timestamp}, "data": self.data}
+
+  bus.event_class = CustomEvent
+  timestamps = []
+
+  @bus.listen(event_type="1")
+  def func(event):
+    timestamps.append(event["metadata"]["timestamp"])
+
+  @bus.listen(event_type="2")
+  def func2(event):
+    timestamps.append(event["metadata"]["timestamp"])
+
+  bus.fire_multiple(event_types=["1", "2"])
+  assert timestamps == [timestamp, timestamp]
+
+
+@pytest.fixture(params=["c", "python"])
+def dispatch(request):
+  if request.param == "c":
+    return pytest.importorskip("eventflow._dispatch").dispatch
+
+  return bus_module._dispatch_py
+
+
+def test_dispatch_order(dispatch):
+  calls = []
+  dispatch((lambda event: calls.append(1), lambda event: calls.append(2), calls.append), "event")
+  assert calls == [1, 2, "event"]
+
+
+def test_dispatch_exception(dispatch):
+  calls = []
+
+  def func(event):
+    raise KeyError("patient_id")
+
+  with pytest.raises(KeyError):
+    dispatch((calls.append, func, calls.append), "event")
+
+  assert calls == ["event"]
+
+
+def test_dispatch_not_tuple(dispatch):
+  with pytest.raises(TypeError):
+    dispatch([print], "event")